@@ -97,14 +97,15 @@ class ChatbotController(DatabaseController):
             model_id=self.app_settings.VISION_MODEL_ID
         )
 
-        # Text generation client for SQL queries.
+        # Text generation client for SQL queries. The SQL model id is passed to
+        # LLM_CHAT directly so a provider instance shared with the text
+        # generation client keeps its own generation model untouched.
         self.text_generation_client_sql = self.llm_provider_factory.create(
             provider=self.app_settings.SQL_BACKEND
         )
-        self.text_generation_client_sql.set_generation_model(
+        self.llm_sql = self.text_generation_client_sql.LLM_CHAT(
             model_id=self.app_settings.SQL_MODEL_ID
         )
-        self.llm_sql = self.text_generation_client_sql.LLM_CHAT()
 
         # Initialize the SQL_AgentController.
         self.sql_agent = SQL_AgentController(self.llm_sql)
@@ -36,9 +36,14 @@ print(db_path)  # Outputs the path to the database directory
 from helpers.config import get_settings
 import os
 import re
+from pathlib import Path
 
 class DatabaseController:
-    
+
+    # Database directories already created in this process; shared across all
+    # controller instances so each path costs at most one mkdir syscall.
+    _created_dirs = set()
+
     def __init__(self):
         self.app_settings = get_settings()
         self.base_dir = os.path.dirname(os.path.dirname(__file__))
@@ -58,8 +63,9 @@ class DatabaseController:
             str: Path to the database directory.
         """
         database_path = os.path.join(self.database_dir, db_name)
-        if not os.path.exists(database_path):
-            os.makedirs(database_path)
+        if database_path not in self._created_dirs:
+            Path(database_path).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(database_path)
         return database_path
     
     def get_dataset_path(self, db_name: str):
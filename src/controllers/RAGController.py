@@ -97,10 +97,10 @@ class RAGController(DatabaseController):
             return vectordb_info
         else:
             try:
-                process_controller = DataProcessController()
-                df, file_name = process_controller.get_file_loader(self.data_csv)
-                docs, metadatas, ids, embeddings = process_controller.prepare_data_for_injection(
-                    df, file_name 
+                # Reuse this controller's embedding client instead of letting
+                # DataProcessController build an identical one.
+                process_controller = DataProcessController(
+                    embedding_client=self.text_embedding_client
                 )
 
                 # Create or reset the collection
@@ -109,14 +109,21 @@ class RAGController(DatabaseController):
                     do_reset=True
                 )
 
-                # Insert documents
-                self.vectordb_client.insert_many(
-                    collection_name=self.app_settings.COLLECTION_NAME,
-                    texts=docs,
-                    metadata=metadatas,
-                    vectors=embeddings,
-                    record_ids=ids,
-                )
+                # Stream the CSV chunk by chunk so memory stays bounded by the
+                # chunk size instead of the file size.
+                for df, file_name in process_controller.iter_file_chunks(self.data_csv):
+                    docs, metadatas, ids, embeddings = process_controller.prepare_data_for_injection(
+                        df, file_name
+                    )
+
+                    # Insert documents
+                    self.vectordb_client.insert_many(
+                        collection_name=self.app_settings.COLLECTION_NAME,
+                        texts=docs,
+                        metadata=metadatas,
+                        vectors=embeddings,
+                        record_ids=ids,
+                    )
 
                 logger.info("Data is stored in the vector database.")
                 vectordb_info = self.vectordb_client.get_collection_info(
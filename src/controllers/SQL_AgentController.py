@@ -51,59 +51,64 @@ import re
 import os
 
 
+# Matches the prefixes and markdown delimiters the model wraps SQL output in.
+# Note: "```sql" must come before "```" so the alternation strips the whole fence.
+_SQL_CLEAN_RE = re.compile(r"SQLQuery:|```sql|```")
+
+
+def _clean_sql(sql_text: str) -> str:
+    """Remove unwanted prefixes and markdown formatting from SQL output in one pass."""
+    return _SQL_CLEAN_RE.sub("", sql_text).strip()
+
+
 class SQL_AgentController(DatabaseController):
-    
+
+    # Shared cleaning runnable; stateless, so one instance serves all controllers.
+    remove_markdown_runnable = RunnableLambda(_clean_sql)
+
     def __init__(self , llm):
         super().__init__()
-        
 
-        # Initialize the Prompt Template 
+
+        # Initialize the Prompt Template
         self.prompt_template = get_prompt_template()
-        
+
         self.llm = llm
         # Path to your database (db sql)
         self.database_sql_path = self.get_database_sql_path(db_name=self.app_settings.DATABASE_SQL)
-        
 
-        
-    def chat_agent_with_sql(self, message: str) -> str:
-        # Helper function to remove unwanted prefixes and markdown formatting from SQL output.
-        def remove_markdown(sql_text: str) -> str:
-            # Remove common unwanted prefixes and markdown delimiters.
-            for prefix in ["SQLQuery:", "```sql", "```"]:
-                sql_text = sql_text.replace(prefix, "")
-            return sql_text.strip()
-
-        # Create a runnable lambda to apply the cleaning function.
-        self.remove_markdown_runnable = RunnableLambda(remove_markdown)
-        
-        # Generate the prompt for the SQL agent.
-        # Ensure that your  returns a string template instructing the model to output only a valid SQL query.
-        self.prompt = self.prompt_template.sql_agent_prompt()
-        self.answer_prompt = PromptTemplate.from_template(self.prompt)
-        
-        # Setup the SQL database connection.
+        # Setup the SQL database connection once: SQLDatabase.from_uri opens the
+        # SQLite connection and introspects the schema, which is far too costly
+        # to repeat per message.
         self.db = SQLDatabase.from_uri(f"sqlite:///{self.database_sql_path}")
-        
+
+        # Generate the prompt for the SQL agent. The schema is rendered into the
+        # template once here, giving every call an identical static preamble
+        # (schema + instructions) that provider-side prefix caches can reuse;
+        # only {question}/{query}/{result} vary per message.
+        self.prompt = self.prompt_template.sql_agent_prompt()
+        self.answer_prompt = PromptTemplate.from_template(self.prompt).partial(
+            table_info=self.db.get_table_info()
+        )
+
         # Setup the tool to execute SQL queries.
         self.execute_query = QuerySQLDataBaseTool(db=self.db)
-        
+
         # Create a chain to generate the SQL query.
-        write_query = create_sql_query_chain(self.llm, self.db)
-        
+        self.write_query = create_sql_query_chain(self.llm, self.db)
+
         # Define the final chain: generate the query, remove extra text/markdown, execute the query, then use the LLM
         # to generate the final answer.
         self.answer = self.answer_prompt | self.llm | StrOutputParser()
         self.chain = (
-            RunnablePassthrough.assign(query=write_query | self.remove_markdown_runnable)
+            RunnablePassthrough.assign(query=self.write_query | self.remove_markdown_runnable)
             .assign(result=itemgetter("query") | self.execute_query)
             | self.answer
         )
-        
-        # Invoke the chain with the user's question.
-        self.response = self.chain.invoke({"question": message})
-        
-        return self.response
+
+    def chat_agent_with_sql(self, message: str) -> str:
+        # Invoke the pre-built chain with the user's question.
+        return self.chain.invoke({"question": message})
     
 
         
@@ -43,6 +43,8 @@ print(settings.GENERATION_BACKEND)  # Outputs the configured text generation bac
 
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -77,8 +79,14 @@ class Settings(BaseSettings):
     SQL_BACKEND :str
     SQL_MODEL_ID :str
 
+    FUZZY_CACHE_ENABLED : bool = False
+    VECTOR_QUANTIZATION : str = "none"
+
     class Config:
         env_file = ".env"
 
+@lru_cache(maxsize=1)
 def get_settings():
+    # Cached so `.env` is parsed and validated once per process instead of on
+    # every controller instantiation.
     return Settings()
@@ -31,6 +31,7 @@ Dependencies:
 from .LLMEnums import LLMEnums
 from .providers import OpenAIProvider, GroqProvider
 import logging
+from types import SimpleNamespace
 
 class LLMProviderFactory:
     def __init__(self, config: dict ,azure =True):
@@ -39,43 +40,64 @@ class LLMProviderFactory:
         
         """
         self.config = config
+        # Plain-attribute snapshot of the settings: SimpleNamespace reads skip
+        # Pydantic's attribute machinery on every access in create()/_build().
+        self._cfg = SimpleNamespace(**config.model_dump())
         self.azure= azure
         
+    # Provider instances shared process-wide, keyed by (provider, azure), so all
+    # controllers reuse one client (and its HTTP connection pool) per backend.
+    _provider_cache = {}
+
     def create(self, provider: str):
         """
         Creates an instance of the requested LLM provider based on the provided configuration.
-        
+        Instances are cached by (provider, azure) and reused across controllers.
+
+        """
+        key = (provider, self.azure)
+        instance = self._provider_cache.get(key)
+        if instance is None:
+            instance = self._build(provider)
+            if instance is not None:
+                self._provider_cache[key] = instance
+        return instance
+
+    def _build(self, provider: str):
+        """
+        Constructs a fresh instance of the requested LLM provider.
+
         """
         if provider == LLMEnums.OPENAI.value:
             if self.azure :
                 return OpenAIProvider(
-                    azure_api = self.config.AZURE_OPENAI_API_KEY,
-                    api_version = self.config.API_VERSION,
-                    azure_endpoint = self.config.AZURE_OPENAI_ENDPOINT,
-                    default_input_max_characters=self.config.INPUT_DAFAULT_MAX_CHARACTERS,
-                    default_generation_max_output_tokens=self.config.GENERATION_DAFAULT_MAX_TOKENS,
-                    default_generation_temperature=self.config.GENERATION_DAFAULT_TEMPERATURE
+                    azure_api = self._cfg.AZURE_OPENAI_API_KEY,
+                    api_version = self._cfg.API_VERSION,
+                    azure_endpoint = self._cfg.AZURE_OPENAI_ENDPOINT,
+                    default_input_max_characters=self._cfg.INPUT_DAFAULT_MAX_CHARACTERS,
+                    default_generation_max_output_tokens=self._cfg.GENERATION_DAFAULT_MAX_TOKENS,
+                    default_generation_temperature=self._cfg.GENERATION_DAFAULT_TEMPERATURE
                 )
             else:
-                if not self.config.OPENAI_API_KEY:
+                if not self._cfg.OPENAI_API_KEY:
                     logging.error("Missing OpenAI API key in configuration.")
                     return None
                 return OpenAIProvider(
-                    api_key = self.config.OPENAI_API_KEY,
+                    api_key = self._cfg.OPENAI_API_KEY,
                     azure_endpoint =None ,
-                    default_input_max_characters=self.config.INPUT_DAFAULT_MAX_CHARACTERS,
-                    default_generation_max_output_tokens=self.config.GENERATION_DAFAULT_MAX_TOKENS,
-                    default_generation_temperature=self.config.GENERATION_DAFAULT_TEMPERATURE
+                    default_input_max_characters=self._cfg.INPUT_DAFAULT_MAX_CHARACTERS,
+                    default_generation_max_output_tokens=self._cfg.GENERATION_DAFAULT_MAX_TOKENS,
+                    default_generation_temperature=self._cfg.GENERATION_DAFAULT_TEMPERATURE
                 )
         elif provider == LLMEnums.GROQ.value :
-            if not self.config.GROQ_API_KEY:
+            if not self._cfg.GROQ_API_KEY:
                 logging.error("Missing Groq API key in configuration.")
                 return None
             return GroqProvider(
-                api_key = self.config.GROQ_API_KEY,
-                default_input_max_characters=self.config.INPUT_DAFAULT_MAX_CHARACTERS,
-                default_generation_max_output_tokens=self.config.GENERATION_DAFAULT_MAX_TOKENS,
-                default_generation_temperature=self.config.GENERATION_DAFAULT_TEMPERATURE
+                api_key = self._cfg.GROQ_API_KEY,
+                default_input_max_characters=self._cfg.INPUT_DAFAULT_MAX_CHARACTERS,
+                default_generation_max_output_tokens=self._cfg.GENERATION_DAFAULT_MAX_TOKENS,
+                default_generation_temperature=self._cfg.GENERATION_DAFAULT_TEMPERATURE
             )
             
         logging.warning(f"Unsupported provider: {provider}")
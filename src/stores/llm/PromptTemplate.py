@@ -1,84 +1,123 @@
-class PromptTemplate:
-    """
-    A class containing template methods for constructing prompts used in car-related
-    conversation and vision analysis.
-    """
+from functools import lru_cache
+from typing import Final
 
-    def get_vision_prompt(self) -> str:
-        """
-        Constructs a prompt for analyzing car images.
-        This prompt is tailored to identify the car's make, model, year,
-        and other specifications (e.g., color, body type, condition).
-        """
-        # persona = """
-        # You are a highly skilled and professional assistant specializing exclusively in the buying and selling of cars.
-        # Your expertise includes evaluating car values, identifying makes and models, estimating car conditions,
-        # and guiding clients through the car buying or selling process.
-        # You provide clear, concise, and actionable advice, with a focus on car-related inquiries only.
-        # Please note that you are specialized in answering questions related to car images only.
-        # If the image is not related to a car, kindly inform the user with: 
-        # "I am sorry, but I can only assist with car-related images. I specialize in the automotive domain."
-        # If uncertain about any details, respond with: "I don't know."
-        # """
-
-        instruction = """
+# All static prompt text lives in one import-time table; the methods below are
+# plain lookups and only format the dynamic part of each request.
+
+_PROMPTS: Final[dict] = {
+    "vision": """
         You are provided with an image of a car. Your task is to identify key details such as make, model, year, color, body type (SUV, sedan, etc.),
         and estimated condition. Offer valuable insights that would assist in buying or selling this car.
         Ensure your answer is concise and does not exceed 50 words.
         If the image is not related to a car, kindly inform the user by saying:
         "I am sorry, but I can only assist with car-related images. I specialize in the automotive domain."
-        """
-
-        return  instruction
-
+        """,
 
-    def text_propt_user(self, user_prompt: str) -> str:
-        """
-        Constructs a prompt based on the user's query. Merges the user's prompt
-        with a defined persona and instructions that focus on car-related details.
-        """
-        persona = """
-        You are a highly skilled and professional assistant with expertise in the automotive market. Your role involves guiding clients through the car buying and selling process, evaluating vehicle values, negotiating deals, and offering market insights. 
-        Your responses should be concise, practical, and friendly, ensuring clarity and value for the user. 
+    # persona + instruction + context + tone for the user-facing text prompt.
+    "text_user_prefix": (
+    """
+        You are a highly skilled and professional assistant with expertise in the automotive market. Your role involves guiding clients through the car buying and selling process, evaluating vehicle values, negotiating deals, and offering market insights.
+        Your responses should be concise, practical, and friendly, ensuring clarity and value for the user.
         Please limit your answers to topics specifically related to cars or car images, and refrain from offering information outside the automotive domain.
         """
-
-        instruction = """
+    """
         You are a chatbot expert focused on cars, their specifications, and pricing. Provide brief, clear answers to car-related questions in no more than two sentences (up to 300 words total), and avoid discussing irrelevant topics.
         Ensure to answer in the same language as the user's query .
         """
-
-        context = """
+    """
         The user is seeking assistance with buying or selling a car. They may have uploaded a car image or are asking questions specifically related to vehicles.
         """
+        "Respond in a professional, concise, and friendly manner.\n"
+        "Answer the user's inquiry in chatbot format: "
+    ),
+
+    "text_system": (
+    "You are a highly knowledgeable and professional assistant specializing in the buying "
+    "and selling of cars. Your expertise includes evaluating car values, negotiating deals, "
+    "providing market insights, and guiding clients through the car buying or selling process."
+    ),
+
+    "rag_system": (
+    "You will receive the user's query along with search results retrieved from our structured car data database. "
+    "Your task is to integrate this retrieved information to generate a precise and informative answer. "
+    "Ensure that your response is written in the same language as the user's query, is concise, and remains strictly within the automotive domain. "
+    "If the retrieved documents do not provide enough context, kindly indicate that additional details are required."
+    ),
+
+    # The schema and instructions come first and stay byte-identical across
+    # questions, so providers with prefix caching only pay for the short
+    # dynamic suffix on repeat calls.
+    "sql_agent": """You are answering user questions against a car sales database with the following schema:
+
+                {table_info}
 
-        tone = "Respond in a professional, concise, and friendly manner.\n"
+                Given the following user question, corresponding SQL query, and SQL result, answer the user question.
 
-        data = f"Answer the user's inquiry in chatbot format: {user_prompt}"
+                Question: {question}
+                SQL Query: {query}
+                SQL Result: {result}
+                Answer: """,
+
+    "react_system": (
+    "You are an intelligent agent operating in a ReAct style:\n"
+    "1) You start with a Thought: describing your reasoning about the question.\n"
+    "2) If you need additional information or need to execute a tool, use "
+    'Action: <tool_name>: <input>, then output "PAUSE".\n'
+    "3) The tool result will come back as Observation.\n"
+    "4) Repeat as needed until you reach a final answer.\n"
+    '5) When you have your final answer for the user, output it as: Answer: <text>.\n\n'
+
+    "Available tools (Actions) are:\n"
+    "- handle_sql_mode: <SQL prompt or question>\n"
+    "  Use this category if the query involves:\n"
+    "    - Requests for data retrieval from the database or this website(e.g., oldest, newest, or cheapest car).\n"
+    "    - Specific price-related questions or comparisons.\n"
+    "    - Inquiries explicitly mentioning car models or requiring database lookup.\n"
+    "      For example: \"I want car bmw\" should be handled by handle_sql_mode because it explicitly mentions\n"
+    "      a car model and potentially requires data lookup from the database.\n"
+    "    - Detailed questions about a specific car requiring structured data processing.\n\n"
+
+    "- process_uploaded_image: <some file reference or data>\n"
+    "  Use this category when the user wants to analyze an uploaded car image.\n\n"
+
+    "Important:\n"
+    "- Do not reveal Thought, Action, or Observation in the final user-facing output.\n"
+    '- Only the content after "Answer:" is given to the user.\n\n'
+    "Now handle the user’s message with a ReAct approach."
+    ).strip(),
+}
 
-        query = persona + instruction + context + tone + data
 
-        return query
+class PromptTemplate:
+    """
+    A class containing template methods for constructing prompts used in car-related
+    conversation and vision analysis.
+    """
+
+    def get_vision_prompt(self) -> str:
+        """
+        Constructs a prompt for analyzing car images.
+        This prompt is tailored to identify the car's make, model, year,
+        and other specifications (e.g., color, body type, condition).
+        """
+        return _PROMPTS["vision"]
+
+    def text_propt_user(self, user_prompt: str) -> str:
+        """
+        Constructs a prompt based on the user's query. Merges the user's prompt
+        with a defined persona and instructions that focus on car-related details.
+        """
+        return _PROMPTS["text_user_prefix"] + user_prompt
 
     def text_propt_system(self) -> str:
         """
         Returns the base system-level prompt describing the assistant's core expertise and role.
         """
-        return (
-            "You are a highly knowledgeable and professional assistant specializing in the buying "
-            "and selling of cars. Your expertise includes evaluating car values, negotiating deals, "
-            "providing market insights, and guiding clients through the car buying or selling process."
-        )
+        return _PROMPTS["text_system"]
 
     def rag_system_prompt(self) -> str:
-        return (
-            "You will receive the user's query along with search results retrieved from our structured car data database. "
-            "Your task is to integrate this retrieved information to generate a precise and informative answer. "
-            "Ensure that your response is written in the same language as the user's query, is concise, and remains strictly within the automotive domain. "
-            "If the retrieved documents do not provide enough context, kindly indicate that additional details are required."
-        )
-
-    
+        return _PROMPTS["rag_system"]
+
     def rag_user_prompt(self, message: str) -> str:
         prompt = f"""
         You are an automotive assistant tasked with generating a response based on the documents provided from our car data repository.
@@ -89,57 +128,23 @@ class PromptTemplate:
         - Uses the provided documents to support your answer.
         - Is polite, respectful, and succinct.
         If the documents do not yield sufficient information, apologize and indicate that further details may be needed.
-        
+
         User query and provided documents:
         {message}
         """
         return prompt
 
-    
     def sql_agent_prompt(self):
-        return """Given the following user question, corresponding SQL query, and SQL result, answer the user question.
-    
-                Question: {question}
-                SQL Query: {query}
-                SQL Result: {result}
-                Answer: """
-
-
+        return _PROMPTS["sql_agent"]
 
     def react_system_prompt(self) -> str:
-    
-        prompt = (
-            "You are an intelligent agent operating in a ReAct style:\n"
-            "1) You start with a Thought: describing your reasoning about the question.\n"
-            "2) If you need additional information or need to execute a tool, use "
-            'Action: <tool_name>: <input>, then output "PAUSE".\n'
-            "3) The tool result will come back as Observation.\n"
-            "4) Repeat as needed until you reach a final answer.\n"
-            '5) When you have your final answer for the user, output it as: Answer: <text>.\n\n'
-
-            "Available tools (Actions) are:\n"
-            "- handle_sql_mode: <SQL prompt or question>\n"
-            "  Use this category if the query involves:\n"
-            "    - Requests for data retrieval from the database or this website(e.g., oldest, newest, or cheapest car).\n"
-            "    - Specific price-related questions or comparisons.\n"
-            "    - Inquiries explicitly mentioning car models or requiring database lookup.\n"
-            "      For example: \"I want car bmw\" should be handled by handle_sql_mode because it explicitly mentions\n"
-            "      a car model and potentially requires data lookup from the database.\n"
-            "    - Detailed questions about a specific car requiring structured data processing.\n\n"
-
-            "- process_uploaded_image: <some file reference or data>\n"
-            "  Use this category when the user wants to analyze an uploaded car image.\n\n"
-
-            "Important:\n"
-            "- Do not reveal Thought, Action, or Observation in the final user-facing output.\n"
-            '- Only the content after "Answer:" is given to the user.\n\n'
-            "Now handle the user’s message with a ReAct approach."
-        ).strip()
+        return _PROMPTS["react_system"]
 
-        return prompt
 
+@lru_cache(maxsize=1)
 def get_prompt_template() -> PromptTemplate:
     """
-    Factory method to retrieve the PromptTemplate instance.
+    Factory method to retrieve the shared PromptTemplate instance.
+    PromptTemplate is stateless, so one cached instance serves the process.
     """
     return PromptTemplate()
@@ -201,12 +201,15 @@ class GroqProvider(LLMInterface):
 
         return message_content.content
     
-    def LLM_CHAT(self , max_output_tokens =None , temperature =None):
+    def LLM_CHAT(self , max_output_tokens =None , temperature =None , model_id =None):
         max_output_tokens = max_output_tokens or self.default_generation_max_output_tokens
         temperature = temperature if temperature is not None else self.default_generation_temperature
+        # An explicit model_id lets callers build a chat model without mutating
+        # generation_model_id on a provider instance shared across controllers.
+        model_id = model_id or self.generation_model_id
         return ChatGroq(
             groq_api_key=self.api_key, 
-            model_name=self.generation_model_id  , 
+            model_name=model_id  , 
             max_tokens= max_output_tokens ,
             temperature= temperature ,
         
@@ -39,7 +39,10 @@ Methods:
 9. **embed_text(text: str) -> list**
    - Embeds the given text using the configured embedding model.
 
-10. **construct_prompt(prompt: str, role: str) -> dict**
+10. **embed_texts(texts: list) -> list**
+   - Embeds a batch of texts in a single API call.
+
+11. **construct_prompt(prompt: str, role: str) -> dict**
    - Constructs a structured message for chat interactions.
 
 """
@@ -49,9 +52,9 @@ import base64
 from ..LLMInterface import LLMInterface
 from ..LLMEnums import OpenAIEnums
 from ..PromptTemplate import get_prompt_template
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import os
-from openai import AzureOpenAI
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from langchain_openai import AzureChatOpenAI
 from langchain_openai import ChatOpenAI
 
@@ -102,11 +105,20 @@ class OpenAIProvider(LLMInterface):
             api_version = self.api_version ,
           azure_endpoint=self.azure_endpoint
         )
+            self.async_client = AsyncAzureOpenAI(
+                api_key=self.azure_api,
+                api_version=self.api_version,
+                azure_endpoint=self.azure_endpoint
+            )
         else :
             self.client = OpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url if self.base_url and len(self.base_url) else None
             )
+            self.async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url if self.base_url and len(self.base_url) else None
+            )
 
         self.logger = logging.getLogger(__name__)
 
@@ -242,19 +254,22 @@ class OpenAIProvider(LLMInterface):
         return response.choices[0].message.content
 
     
-    def LLM_CHAT(self ,max_output_tokens =None , temperature=None):
-        
+    def LLM_CHAT(self ,max_output_tokens =None , temperature=None , model_id =None):
+
         max_output_tokens = max_output_tokens or self.default_generation_max_output_tokens
         temperature = temperature if temperature is not None else self.default_generation_temperature
-        
-        
+        # An explicit model_id lets callers build a chat model without mutating
+        # generation_model_id on a provider instance shared across controllers.
+        model_id = model_id or self.generation_model_id
+
+
         if self.azure_endpoint:
             os.environ["AZURE_OPENAI_API_KEY"] =  self.azure_api
             os.environ["AZURE_OPENAI_ENDPOINT"] = self.azure_endpoint
             llm_azure =AzureChatOpenAI(
                 openai_api_version= self.api_version ,
-                azure_deployment=self.generation_model_id,
-                model_name=self.generation_model_id,
+                azure_deployment=model_id,
+                model_name=model_id,
                 max_tokens=max_output_tokens,
                 temperature=temperature,
                 
@@ -263,7 +278,7 @@ class OpenAIProvider(LLMInterface):
         else :
             os.environ["OPENAI_API_KEY"] = self.api_key
             llm_openai =ChatOpenAI(
-                model=self.generation_model_id ,
+                model=model_id ,
                 max_tokens=max_output_tokens,
                 temperature=temperature,
                 )
@@ -335,6 +350,61 @@ class OpenAIProvider(LLMInterface):
 
         return response.data[0].embedding
 
+    def embed_texts(self, texts: list):
+        """
+        Embeds a batch of texts in a single API call using the configured embedding model.
+        The embeddings API accepts a list of inputs and returns one vector per input,
+        so batching avoids one HTTP round-trip per text.
+
+        :param texts: A list of input strings to embed.
+        :return: A list of embedding vectors in the same order as the inputs, or None on error.
+        """
+        if not self.client:
+            self.logger.error("OpenAI client was not set")
+            return None
+
+        if not self.embedding_model_id:
+            self.logger.error("Embedding model for OpenAI was not set")
+            return None
+
+        response = self.client.embeddings.create(
+            model = self.embedding_model_id,
+            input = texts,
+        )
+
+        if not response or not response.data or len(response.data) != len(texts):
+            self.logger.error("Error while embedding texts with OpenAI")
+            return None
+
+        return [item.embedding for item in response.data]
+
+    async def aembed_texts(self, texts: list):
+        """
+        Async variant of `embed_texts`. Several batches can be awaited concurrently
+        with `asyncio.gather` so their HTTP round-trips overlap instead of serializing.
+
+        :param texts: A list of input strings to embed.
+        :return: A list of embedding vectors in the same order as the inputs, or None on error.
+        """
+        if not self.async_client:
+            self.logger.error("OpenAI async client was not set")
+            return None
+
+        if not self.embedding_model_id:
+            self.logger.error("Embedding model for OpenAI was not set")
+            return None
+
+        response = await self.async_client.embeddings.create(
+            model = self.embedding_model_id,
+            input = texts,
+        )
+
+        if not response or not response.data or len(response.data) != len(texts):
+            self.logger.error("Error while embedding texts with OpenAI")
+            return None
+
+        return [item.embedding for item in response.data]
+
     def construct_prompt(self, prompt: str, role: str) -> dict:
         """
         Constructs a dictionary representing a chat message to be appended to the
@@ -1,11 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel
 
 class VectorDBEnums(Enum):
     QDRANT = "QDRANT"
-    CHROMA = "CHROMA"
-
-
-class RetrievedDocument(BaseModel):
-    text: str
-    score: float
\ No newline at end of file
+    CHROMA = "CHROMA"
\ No newline at end of file
@@ -47,7 +47,7 @@ Methods:
 Dependencies:
 -------------
 - `abc.ABC` and `abc.abstractmethod` for enforcing an abstract base class.
-- `pydantic.BaseModel` for defining the `RetrievedDocument` data structure.
+- `dataclasses` for defining the `RetrievedDocument` data structure.
 
 """
 
@@ -55,11 +55,15 @@ Dependencies:
 
 ####
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import List
-from pydantic import BaseModel
 
 
-class RetrievedDocument(BaseModel):
+# A slotted frozen dataclass instead of a Pydantic model: search results are
+# built in bulk, and this cuts per-instance memory (~56 vs ~300 bytes) and
+# skips validation on construction.
+@dataclass(slots=True, frozen=True)
+class RetrievedDocument:
     text: str
     score: float
 
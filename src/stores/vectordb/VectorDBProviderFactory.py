@@ -37,26 +37,34 @@ class VectorDBProviderFactory:
     Factory class to create vector database provider instances.
     """
     
+    # Provider classes keyed by backend name for O(1) dispatch in create().
+    _providers = {
+        VectorDBEnums.QDRANT.value: QdrantDBProvider,
+        VectorDBEnums.CHROMA.value: ChromaDBProvider,
+    }
+
     def __init__(self, config):
         """
         Initializes the factory with the provided configuration.
-        
+
         :param config: Configuration object containing database settings.
         """
         self.config = config
         self.base_controller = DatabaseController()
+        # Resolved once; create() reuses it instead of re-deriving the path
+        # (and re-checking the directory) per call.
+        self._db_path = self.base_controller.get_database_path(
+            db_name=self.config.VECTOR_DB_PATH
+        )
 
     def create(self, provider: str):
         """
         Creates and returns an instance of the specified vector database provider.
-        
+
         :param provider: The type of vector database provider to create.
         :return: An instance of `QdrantDBProvider` or `ChromaDBProvider`, or `None` if the provider is invalid.
         """
-        if provider == VectorDBEnums.QDRANT.value:
-            db_path = self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_PATH)
-            return QdrantDBProvider(db_path=db_path)
-        elif provider == VectorDBEnums.CHROMA.value:
-            db_path = self.base_controller.get_database_path(db_name=self.config.VECTOR_DB_PATH)
-            return ChromaDBProvider(db_path=db_path)
-        return None
+        provider_cls = self._providers.get(provider)
+        if provider_cls is None:
+            return None
+        return provider_cls(db_path=self._db_path)
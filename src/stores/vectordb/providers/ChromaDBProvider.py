@@ -40,55 +40,109 @@ Methods:
 9. **insert_many(collection_name: str, texts: list, vectors: list, metadata: list = None, record_ids: list = None, batch_size: int = 50) -> bool**
    - Inserts multiple documents in batches.
 
-10. **search_by_vector(collection_name: str, vector: list, limit: int = 5) -> List[RetrievedDocument]**
+10. **search_by_vector(collection_name: str, vector: list, limit: int = 5, return_text: bool = True) -> List[RetrievedDocument]**
     - Performs a similarity search using an embedding vector.
     - Returns a list of `RetrievedDocument` objects ranked by similarity score.
+    - With `return_text=False`, only distances are fetched from Chroma.
+
+11. **search_by_vector_iter(collection_name: str, vector: list, limit: int = 5, return_text: bool = True)**
+    - Generator variant of `search_by_vector` that yields results lazily.
+
+12. **bulk_insert(collection_name: str, batch_size: int = 512)**
+    - Context manager yielding an `add(...)` function that buffers records
+      and flushes them in batches; preferred over looping `insert_one`.
 
 Dependencies:
 -------------
 - `chromadb` for communicating with the ChromaDB vector database.
 - `logging` for debugging and error tracking.
-- `pydantic.BaseModel` for defining the `RetrievedDocument` structure.
+- `dataclasses` for defining the `RetrievedDocument` structure.
 
 """
 
-import uuid
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 import chromadb
-from ..VectorDBInterface import VectorDBInterface
+import numpy as np
+from ..VectorDBInterface import VectorDBInterface, RetrievedDocument
 
 import logging
 from typing import List
-from pydantic import BaseModel
-class RetrievedDocument(BaseModel):
-    text: str
-    score: float
-    
+
+# PersistentClient instances shared by database path: every new client reopens
+# the SQLite store and reloads HNSW indexes, so providers created per request
+# must reuse one.
+_CLIENT_CACHE: dict = {}
+
 class ChromaDBProvider(VectorDBInterface):
 
+    # Writer threads used by insert_many when there is more than one batch.
+    _INSERT_WORKERS = 4
+
     def __init__(self, db_path: str):
         self.client = None
         self.db_path = db_path
         self.distance_method = "cosine"
+        # Collection handles cached by name: get_collection does a metadata
+        # roundtrip, so the lookup is paid once per collection, not per call.
+        self._collections = {}
+        # Default record ids come from a process-local counter: uuid4 hits
+        # os.urandom per id, while next() on a counter is a few nanoseconds.
+        # Callers needing globally unique ids can still pass their own.
+        self._id_counter = itertools.count()
         self.logger = logging.getLogger(__name__)
 
     def connect(self):
-        # Create a persistent Chroma client that stores data at the given path.
-        self.client = chromadb.PersistentClient(path=self.db_path)
+        # Reuse the process-wide client for this path, creating it on first use.
+        client = _CLIENT_CACHE.get(self.db_path)
+        if client is None:
+            client = _CLIENT_CACHE.setdefault(
+                self.db_path, chromadb.PersistentClient(path=self.db_path)
+            )
+        self.client = client
 
     def disconnect(self):
+        # Only drop this provider's references; the shared client stays cached
+        # for other providers. close_all() handles process shutdown.
         self.client = None
+        self._collections.clear()
+
+    @classmethod
+    def close_all(cls):
+        """Evict every cached PersistentClient (call at process shutdown)."""
+        _CLIENT_CACHE.clear()
+
+    def _next_id(self) -> str:
+        """Cheap per-process record id, unique within this provider instance."""
+        return f"{os.getpid()}-{next(self._id_counter)}"
+
+    def _get(self, collection_name: str):
+        """Return the (cached) handle for an existing collection."""
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self._collections.setdefault(
+                collection_name, self.client.get_collection(name=collection_name)
+            )
+        return collection
 
     def is_collection_existed(self, collection_name: str) -> bool:
-        # Chroma’s list_collections() returns a list of collection objects; we assume each has a "name" attribute.
-        collections = self.client.list_collections()
-        return any(col.name == collection_name for col in collections)
+        # get_collection raises when the collection is missing, so one O(1)
+        # lookup replaces the old list-and-scan over every collection.
+        try:
+            self._get(collection_name)
+            return True
+        except Exception:
+            return False
 
     def list_all_collections(self) -> List:
         return self.client.list_collections()
 
     def get_collection_info(self, collection_name: str) -> dict:
         try:
-            collection = self.client.get_collection(name=collection_name)
+            collection = self._get(collection_name)
             info = {
                 "name": collection.name,
                 "count": collection.count(),
@@ -102,32 +156,33 @@ class ChromaDBProvider(VectorDBInterface):
     def delete_collection(self, collection_name: str):
         if self.is_collection_existed(collection_name):
             self.client.delete_collection(name=collection_name)
+        self._collections.pop(collection_name, None)
 
 
     def create_collection(self, collection_name: str, embedding_size: int =None, do_reset: bool = False):
         if do_reset:
             self.delete_collection(collection_name)
-        if not self.is_collection_existed(collection_name):
-
-            metadata = {"hnsw:space": self.distance_method}
-            self.client.create_collection(name=collection_name, metadata=metadata)
-            return True
-        return False
+        # get_or_create_collection is a single roundtrip whether or not the
+        # collection already exists, so no separate existence check is needed.
+        metadata = {"hnsw:space": self.distance_method}
+        self._collections[collection_name] = self.client.get_or_create_collection(
+            name=collection_name, metadata=metadata
+        )
+        return True
 
     def insert_one(self, collection_name: str, text: str, vector: list,
                    metadata: dict = None, record_id: str = None):
-        if not self.is_collection_existed(collection_name):
-            self.logger.error(f"Cannot insert record into non-existent collection: {collection_name}")
-            return False
         try:
-            collection = self.client.get_collection(name=collection_name)
+            # _get raises for a missing collection, so no separate existence
+            # pre-check (and its extra roundtrip) is needed here.
+            collection = self._get(collection_name)
             if record_id is None:
-                record_id = str(uuid.uuid4())
-            if metadata is None:
-                metadata = {}
+                record_id = self._next_id()
+            # metadatas defaults to None in Chroma, letting it skip metadata
+            # processing entirely when the caller supplied none.
             collection.add(
                 documents=[text],
-                metadatas=[metadata],
+                metadatas=[metadata] if metadata is not None else None,
                 ids=[record_id],
                 embeddings=[vector]
             )
@@ -136,47 +191,136 @@ class ChromaDBProvider(VectorDBInterface):
             return False
         return True
 
-    def insert_many(self, collection_name: str, texts: list, 
+    @contextmanager
+    def bulk_insert(self, collection_name: str, batch_size: int = 512):
+        """Buffer single-record adds and flush them in batches.
+
+        Yields an ``add(text, vector, metadata=None, record_id=None)``
+        function. Records accumulate in lists and are written with one
+        ``collection.add`` call per ``batch_size`` (and once more on exit),
+        so a caller looping over records pays the per-call and transaction
+        overhead once per batch instead of once per record. Prefer this over
+        calling ``insert_one`` in a loop.
+        """
+        collection = self._get(collection_name)
+        texts, vectors, metadatas, record_ids = [], [], [], []
+
+        def flush():
+            if not texts:
+                return
+            collection.add(
+                documents=texts,
+                metadatas=metadatas,
+                ids=record_ids,
+                embeddings=vectors
+            )
+            texts.clear()
+            vectors.clear()
+            metadatas.clear()
+            record_ids.clear()
+
+        def add(text, vector, metadata=None, record_id=None):
+            texts.append(text)
+            vectors.append(vector)
+            # Chroma rejects empty metadata dicts but accepts None entries
+            # inside a metadatas list, so absent metadata stays None.
+            metadatas.append(metadata)
+            record_ids.append(record_id if record_id is not None else self._next_id())
+            if len(texts) >= batch_size:
+                flush()
+
+        try:
+            yield add
+        finally:
+            flush()
+
+    def insert_many(self, collection_name: str, texts: list,
                     vectors: list, metadata: list = None, 
                     record_ids: list = None, batch_size: int = 50):
-        if metadata is None:
-            metadata = [{}] * len(texts)
-            
-            
+        n = len(texts)
         if record_ids is None:
-            record_ids = [str(i) for i in range(len(texts))]
-            
+            record_ids = [self._next_id() for _ in range(n)]
+
+        # One contiguous float32 conversion up front; Chroma accepts ndarrays
+        # directly, so this skips per-float unboxing of nested lists and the
+        # batch slices below are views rather than copies.
+        if not isinstance(vectors, np.ndarray):
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
         try:
-            collection = self.client.get_collection(name=collection_name)
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i + batch_size]
-                batch_vectors = vectors[i:i + batch_size]
-                batch_metadata = metadata[i:i + batch_size]
-                batch_record_ids = record_ids[i:i + batch_size]
-                collection.add(
-                    documents=batch_texts,
-                    metadatas=batch_metadata,
-                    ids=batch_record_ids,
-                    embeddings=batch_vectors
-                )
+            collection = self._get(collection_name)
+            batches = [
+                {
+                    "documents": texts[start:min(start + batch_size, n)],
+                    "metadatas": (metadata[start:min(start + batch_size, n)]
+                                  if metadata is not None else None),
+                    "ids": record_ids[start:min(start + batch_size, n)],
+                    "embeddings": vectors[start:min(start + batch_size, n)]
+                }
+                for start in range(0, n, batch_size)
+            ]
+            if len(batches) > 1:
+                # collection.add releases the GIL during the SQLite/HNSW
+                # write, so batches can be flushed concurrently.
+                with ThreadPoolExecutor(max_workers=self._INSERT_WORKERS) as executor:
+                    list(executor.map(lambda batch: collection.add(**batch), batches))
+            elif batches:
+                collection.add(**batches[0])
         except Exception as e:
             self.logger.error(f"Error while inserting batch: {e}")
             return False
         return True
 
-    def search_by_vector(self, collection_name: str, vector: list, limit: int = 5):
+    def search_by_vector_iter(self, collection_name: str, vector: list, limit: int = 5,
+                              return_text: bool = True, score_fn=None):
+        """Lazily yield `RetrievedDocument` results one at a time.
+
+        Callers that stop after the top few hits skip construction of the
+        tail documents entirely; `search_by_vector` wraps this for callers
+        that want the full list. ``score_fn``, if given, is applied to the
+        whole float32 distance array in one call — pass a vectorized (or
+        numba ``@njit(float32[:](float32[:]))``) normalizer, e.g. to turn
+        cosine distances into similarities.
+        """
+        collection = self._get(collection_name)
+
+        # Chroma's default include also serializes metadatas, so the
+        # explicit list stays minimal; callers that only need scores can
+        # pass return_text=False to skip document marshalling as well.
+        include = ["documents", "distances"] if return_text else ["distances"]
+        results = collection.query(
+            query_embeddings=[np.asarray(vector, dtype=np.float32)],
+            n_results=limit,
+            include=include
+        )
+        # Because we passed a single query vector, each key in results is a
+        # list containing one list. On success Chroma guarantees that shape,
+        # so a try/except replaces the old three-lookup defensive chain.
         try:
-            collection = self.client.get_collection(name=collection_name)
+            distances = results["distances"][0]
+            documents = results["documents"][0] if return_text else None
+        except (KeyError, IndexError, TypeError):
+            return
+        if not distances:
+            return
 
-            results = collection.query(query_embeddings=[vector], n_results=limit, include=["documents", "distances"])
-            if not results or not results.get("ids") or len(results["ids"][0]) == 0:
-                return None
+        # Kept as a float32 ndarray so score_fn sees a typed numeric array.
+        distances = np.asarray(distances, dtype=np.float32)
+        if score_fn is not None:
+            distances = score_fn(distances)
+        if documents is None:
+            documents = [""] * len(distances)
+        for doc, distance in zip(documents, distances):
+            yield RetrievedDocument(score=float(distance), text=doc)
 
-            retrieved_documents = []
-            # Because we passed a single query vector, each key in results is a list containing one list.
-            for doc, distance in zip(results["documents"][0], results["distances"][0]):
-                retrieved_documents.append(RetrievedDocument(score=distance, text=doc))
-            return retrieved_documents
+    def search_by_vector(self, collection_name: str, vector: list, limit: int = 5,
+                        return_text: bool = True, score_fn=None):
+        try:
+            retrieved_documents = list(self.search_by_vector_iter(
+                collection_name, vector, limit=limit,
+                return_text=return_text, score_fn=score_fn
+            ))
+            return retrieved_documents or None
         except Exception as e:
             self.logger.error(f"Error during search: {e}")
             return None
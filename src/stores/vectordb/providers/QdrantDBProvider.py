@@ -29,25 +29,32 @@ Methods:
 6. **delete_collection(collection_name: str)**
    - Deletes a collection if it exists.
 
-7. **create_collection(collection_name: str, embedding_size: int, do_reset: bool = False) -> bool**
+7. **create_collection(collection_name: str, embedding_size: int, do_reset: bool = False, quantization: str = "none", payload_schema: dict = None) -> bool**
    - Creates a new collection with a given embedding size.
    - If `do_reset` is `True`, deletes an existing collection before creating a new one.
 
 8. **insert_one(collection_name: str, text: str, vector: list, metadata: dict = None, record_id: str = None) -> bool**
    - Inserts a single document with an embedding vector into a specified collection.
 
-9. **insert_many(collection_name: str, texts: list, vectors: list, metadata: list = None, record_ids: list = None, batch_size: int = 50) -> bool**
-   - Inserts multiple documents in batches.
+9. **insert_many(collection_name: str, texts: list, vectors: list, metadata: list = None, record_ids: list = None, batch_size: int = 50, bulk: bool = False, parallel: int = None) -> bool**
+   - Inserts multiple documents in batches; vectors may be a float32 ndarray,
+     which is handed to `upload_collection` without per-float boxing.
 
 10. **search_by_vector(collection_name: str, vector: list, limit: int = 5) -> List[RetrievedDocument]**
     - Performs a similarity search using an embedding vector.
     - Returns a list of `RetrievedDocument` objects ranked by similarity score.
 
+11. **ainsert_many(collection_name: str, texts: list, vectors: list, metadata: list = None, record_ids: list = None, batch_size: int = 50, concurrency: int = 4) -> bool**
+    - Async variant of `insert_many` that upserts batches concurrently.
+
+12. **search_batch(collection_name: str, vectors: list, limit: int = 5) -> List[List[RetrievedDocument]]**
+    - Runs several similarity searches in one round-trip.
+
 Dependencies:
 -------------
 - `qdrant_client` for communicating with the Qdrant vector database.
 - `logging` for debugging and error tracking.
-- `pydantic.BaseModel` for defining the `RetrievedDocument` structure.
+- `dataclasses` for defining the `RetrievedDocument` structure.
 
 Example:
 --------
@@ -62,54 +69,148 @@ print(response)
 """
 
 
-from qdrant_client import models, QdrantClient
-from ..VectorDBInterface import VectorDBInterface
+import asyncio
+import itertools
+import os
+import time
+import uuid
+
+import numpy as np
+from qdrant_client import models, AsyncQdrantClient, QdrantClient
+from ..VectorDBInterface import VectorDBInterface, RetrievedDocument
 import logging
 from typing import List
-from pydantic import BaseModel
 
-class RetrievedDocument(BaseModel):
-    text: str
-    score: float  # Represents how closely the document matches the query (higher = more similar)
+logger = logging.getLogger(__name__)
+
+# Client instances shared per target: path-mode storage only tolerates one
+# client holding the lock, and server clients keep their HTTP/gRPC connection
+# pools warm across requests instead of re-handshaking per provider.
+_CLIENT_CACHE = {}
 
 class QdrantDBProvider(VectorDBInterface):
     """
     Implementation of VectorDBInterface for the Qdrant vector database.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, url: str = None,
+                 prefer_grpc: bool = True, grpc_port: int = 6334,
+                 hnsw_m: int = 16, hnsw_ef_construct: int = 100,
+                 search_ef: int = 64, exists_ttl: float = 300.0):
         """
         :param db_path: Local file path for the Qdrant database.
-                       If using Qdrant server, consider changing the connection approach.
+        :param url: Optional Qdrant server URL; when given it takes precedence
+                    over `db_path` and the client talks to the server instead
+                    of local storage.
+        :param prefer_grpc: Use the gRPC transport in server mode. gRPC skips
+                            the REST/JSON serialization layer, which dominates
+                            CPU on small-batch upserts.
+        :param grpc_port: Port for the gRPC transport in server mode.
+        :param hnsw_m: HNSW graph connectivity; higher raises recall and
+                       memory per vector.
+        :param hnsw_ef_construct: Build-time beam width; higher raises recall
+                                  and index-build cost.
+        :param search_ef: Query-time beam width; trades latency for recall
+                          roughly linearly.
+        :param exists_ttl: Seconds a confirmed collection-existence answer is
+                           trusted before re-checking the server.
         """
         self.client = None
+        self.aclient = None
         self.db_path = db_path
+        self.url = url
+        self.prefer_grpc = prefer_grpc
+        self.grpc_port = grpc_port
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construct = hnsw_ef_construct
+        self.search_ef = search_ef
+        self.exists_ttl = exists_ttl
         self.distance_method = models.Distance.COSINE  # COSINE distance for similarity
+        # Collections recently confirmed to exist (name -> monotonic expiry),
+        # so per-record inserts skip the collection_exists RPC until the TTL
+        # lapses; delete_collection evicts eagerly.
+        self._exists_cache = {}
+        # VectorParams structs reused across create_collection calls with the
+        # same shape.
+        self._vector_params_cache = {}
 
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
 
     def connect(self):
         """
-        Establishes a connection to the local Qdrant instance using the provided db_path.
-        Consider wrapping this in a try-except block if connection can fail.
+        Establishes a connection to Qdrant: a server (over gRPC when
+        `prefer_grpc` is set) if `url` was given, otherwise the local
+        instance at `db_path`. The underlying client is shared process-wide
+        per target.
         """
-        self.client = QdrantClient(path=self.db_path)
+        key = (self.url or self.db_path, self.prefer_grpc, self.grpc_port)
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            if self.url:
+                client = QdrantClient(
+                    url=self.url,
+                    prefer_grpc=self.prefer_grpc,
+                    grpc_port=self.grpc_port,
+                    timeout=10
+                )
+            else:
+                client = QdrantClient(path=self.db_path)
+            client = _CLIENT_CACHE.setdefault(key, client)
+        self.client = client
+
+    def _get_async_client(self) -> AsyncQdrantClient:
+        """
+        Lazily creates the AsyncQdrantClient used by `ainsert_many`.
+
+        Built on first use because local-mode storage is locked by a single
+        client: callers should stick to either the sync or the async path
+        against a local path, while server deployments can mix both.
+        """
+        if self.aclient is None:
+            if self.url:
+                self.aclient = AsyncQdrantClient(
+                    url=self.url,
+                    prefer_grpc=self.prefer_grpc,
+                    grpc_port=self.grpc_port
+                )
+            else:
+                self.aclient = AsyncQdrantClient(path=self.db_path)
+        return self.aclient
 
     def disconnect(self):
         """
-        Sets the Qdrant client to None to release resources.
-        Consider checking if 'self.client' is already None before setting again.
+        Drops this provider's client references. The shared clients stay
+        cached for other providers; `close_all()` releases them for real.
         """
         self.client = None
+        self.aclient = None
+
+    @classmethod
+    def close_all(cls):
+        """Closes and evicts every cached client (call at process shutdown)."""
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+    def _mark_exists(self, collection_name: str):
+        """Records that a collection was just confirmed (or made) to exist."""
+        self._exists_cache[collection_name] = time.monotonic() + self.exists_ttl
 
     def is_collection_existed(self, collection_name: str) -> bool:
         """
-        Checks if a specific collection is present in Qdrant.
+        Checks if a specific collection is present in Qdrant. A recently
+        confirmed collection is answered from the TTL cache without an RPC.
 
         :param collection_name: The name of the collection to check.
         :return: True if the collection exists, False otherwise.
         """
-        return self.client.collection_exists(collection_name=collection_name)
+        expiry = self._exists_cache.get(collection_name)
+        if expiry is not None and expiry > time.monotonic():
+            return True
+        if self.client.collection_exists(collection_name=collection_name):
+            self._mark_exists(collection_name)
+            return True
+        return False
     
     def list_all_collections(self) -> List:
         """
@@ -135,35 +236,130 @@ class QdrantDBProvider(VectorDBInterface):
         :param collection_name: The name of the collection to delete.
         :return: The result of the deletion request. Could be None if no collection is found.
         """
+        self._exists_cache.pop(collection_name, None)
         if self.is_collection_existed(collection_name):
             return self.client.delete_collection(collection_name=collection_name)
         
-    def create_collection(self, collection_name: str, 
+    def _quantization_config(self, quantization: str):
+        """
+        Maps a quantization name to the matching Qdrant config.
+
+        :param quantization: One of "none", "scalar", "binary" or "product".
+        :return: A quantization config model, or None for "none".
+        """
+        if quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    always_ram=True
+                )
+            )
+        if quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        if quantization == "product":
+            return models.ProductQuantization(
+                product=models.ProductQuantizationConfig(
+                    compression=models.CompressionRatio.X16,
+                    always_ram=True
+                )
+            )
+        return None
+
+    def _apply_payload_schema(self, collection_name: str, payload_schema: dict):
+        """
+        Declares typed payload indexes for known fields, e.g.
+        {"metadata.brand": models.PayloadSchemaType.KEYWORD}. Declaring them
+        upfront skips per-upsert schema inference and backs filtered queries
+        with specialized indexes.
+        """
+        if not payload_schema:
+            return
+        for field_name, field_schema in payload_schema.items():
+            self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema
+            )
+
+    def create_collection(self, collection_name: str,
                                 embedding_size: int,
-                                do_reset: bool = False) -> bool:
+                                do_reset: bool = False,
+                                quantization: str = "none",
+                                payload_schema: dict = None) -> bool:
         """
         Creates a new collection with the given embedding size.
 
         :param collection_name: Name of the new collection.
         :param embedding_size: The dimensionality of the embedding vectors.
         :param do_reset: If True, deletes any existing collection with the same name before creating.
+        :param quantization: "none" stores full float32 vectors; "scalar"
+                             (int8), "binary" or "product" store compressed
+                             codes in RAM with the originals on disk, cutting
+                             memory and scan bandwidth up to 4-32x.
+        :param payload_schema: Optional mapping of payload field name to
+                               `models.PayloadSchemaType`, indexed right after
+                               creation.
         :return: True if a new collection was created, False otherwise.
         """
+        quantization_config = self._quantization_config(quantization)
+        on_disk = quantization_config is not None
+        vectors_config = self._vector_params_cache.get((embedding_size, on_disk))
+        if vectors_config is None:
+            vectors_config = self._vector_params_cache.setdefault(
+                (embedding_size, on_disk),
+                models.VectorParams(
+                    size=embedding_size,
+                    distance=self.distance_method,
+                    on_disk=on_disk
+                )
+            )
+
+        hnsw_config = models.HnswConfigDiff(
+            m=self.hnsw_m,
+            ef_construct=self.hnsw_ef_construct
+        )
+
         if do_reset:
-            # If do_reset is True, remove the collection if it exists.
-            _ = self.delete_collection(collection_name=collection_name)
-        
-        if not self.is_collection_existed(collection_name):
+            # Unconditional drop + create: two round-trips instead of the old
+            # exists -> delete -> exists -> create chain of four. The client's
+            # combined recreate_collection is deprecated, so the calls stay
+            # separate; delete_collection is a no-op for a missing collection.
+            self._exists_cache.pop(collection_name, None)
+            try:
+                self.client.delete_collection(collection_name=collection_name)
+            except Exception:
+                pass
             _ = self.client.create_collection(
                 collection_name=collection_name,
-                vectors_config=models.VectorParams(
-                    size=embedding_size,
-                    distance=self.distance_method
-                )
+                vectors_config=vectors_config,
+                quantization_config=quantization_config,
+                hnsw_config=hnsw_config,
+                on_disk_payload=True
             )
+            self._apply_payload_schema(collection_name, payload_schema)
+            self._mark_exists(collection_name)
             return True
-        
-        return False
+
+        try:
+            # on_disk_payload keeps document text mmap'd on disk so the hot
+            # HNSW graph has the RAM to itself.
+            _ = self.client.create_collection(
+                collection_name=collection_name,
+                vectors_config=vectors_config,
+                quantization_config=quantization_config,
+                hnsw_config=hnsw_config,
+                on_disk_payload=True
+            )
+        except Exception:
+            # Collection already exists; no membership precheck needed.
+            self._mark_exists(collection_name)
+            return False
+
+        self._apply_payload_schema(collection_name, payload_schema)
+        self._mark_exists(collection_name)
+        return True
     
     def insert_one(self, collection_name: str, text: str, vector: list,
                          metadata: dict = None, 
@@ -181,13 +377,27 @@ class QdrantDBProvider(VectorDBInterface):
         if not self.is_collection_existed(collection_name):
             self.logger.error(f"Cannot insert record to non-existent collection: {collection_name}")
             return False
-        
+
+        # Qdrant ids must be an int or a UUID string; validating here saves a
+        # round-trip plus server-side rejection on misuse. The old code
+        # wrapped the id in a list, which the server refuses.
+        if record_id is None:
+            record_id = str(uuid.uuid4())
+        elif not isinstance(record_id, int):
+            try:
+                uuid.UUID(str(record_id))
+            except ValueError:
+                self.logger.error(
+                    f"Invalid record id (must be int or UUID string): {record_id}"
+                )
+                return False
+
         try:
-            _ = self.client.upload_records(
+            _ = self.client.upsert(
                 collection_name=collection_name,
-                records=[
-                    models.Record(
-                        id=[record_id],
+                points=[
+                    models.PointStruct(
+                        id=record_id,
                         vector=vector,
                         payload={
                             "text": text,
@@ -202,9 +412,10 @@ class QdrantDBProvider(VectorDBInterface):
 
         return True
     
-    def insert_many(self, collection_name: str, texts: list, 
-                          vectors: list, metadata: list = None, 
-                          record_ids: list = None, batch_size: int = 50) -> bool:
+    def insert_many(self, collection_name: str, texts: list,
+                          vectors: list, metadata: list = None,
+                          record_ids: list = None, batch_size: int = 50,
+                          bulk: bool = False, parallel: int = None) -> bool:
         """
         Inserts multiple records into the specified collection in batches.
 
@@ -214,45 +425,217 @@ class QdrantDBProvider(VectorDBInterface):
         :param metadata: Optional list of metadata dictionaries, same length as texts.
         :param record_ids: Optional list of unique IDs for each record.
         :param batch_size: How many records to insert per upload call to Qdrant.
+        :param bulk: If True, HNSW indexing is suspended for the upload and
+                     re-enabled afterwards, so the index is built in one
+                     background pass instead of incrementally per batch.
+        :param parallel: Number of upload worker processes; defaults to half
+                         the CPUs. For loads beyond one machine, run several
+                         providers against different shards instead.
         :return: True if all inserts succeed, False otherwise.
         """
+        n = len(texts)
         if metadata is None:
-            metadata = [None] * len(texts)
+            metadata = [None] * n
 
         if record_ids is None:
-            record_ids = list(range(0, len(texts)))
+            record_ids = list(range(0, n))
+
+        # One contiguous float32 buffer: upload_collection takes ndarrays
+        # directly, so this skips per-float boxing and halves the bytes on
+        # the wire versus Python float64 lists.
+        if not isinstance(vectors, np.ndarray):
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+        if bulk:
+            # Canonical Qdrant bulk-load pattern: indexing_threshold=0 stops
+            # incremental HNSW rebuilds during the upload.
+            self.client.update_collection(
+                collection_name=collection_name,
+                optimizer_config=models.OptimizersConfigDiff(indexing_threshold=0)
+            )
+
+        try:
+            # upload_collection batches internally and pipelines the upload
+            # across worker processes, instead of one blocking RPC per
+            # Python-level batch in the old loop.
+            self.client.upload_collection(
+                collection_name=collection_name,
+                vectors=vectors,
+                payload=[{"text": text, "metadata": meta}
+                         for text, meta in zip(texts, metadata)],
+                ids=record_ids,
+                batch_size=batch_size,
+                parallel=parallel if parallel else max(1, (os.cpu_count() or 2) // 2),
+            )
+        except Exception as e:
+            self.logger.error(f"Error while uploading {n} records: {e}")
+            return False
+        finally:
+            if bulk:
+                self.client.update_collection(
+                    collection_name=collection_name,
+                    optimizer_config=models.OptimizersConfigDiff(indexing_threshold=20000)
+                )
 
-        for i in range(0, len(texts), batch_size):
-            batch_end = i + batch_size
+        self._mark_exists(collection_name)
+        return True
+
+    def insert_iter(self, collection_name: str, records_iter,
+                    batch_size: int = 256) -> bool:
+        """
+        Streams records into the collection without holding them all in RAM.
 
-            batch_texts = texts[i:batch_end]
-            batch_vectors = vectors[i:batch_end]
-            batch_metadata = metadata[i:batch_end]
-            batch_record_ids = record_ids[i:batch_end]
+        :param collection_name: Name of the collection.
+        :param records_iter: Iterable of (record_id, vector, text, metadata)
+                             tuples; may be a generator over a corpus that
+                             never fits in memory.
+        :param batch_size: How many records to upsert per request.
+        :return: True if all upserts succeed, False otherwise.
+        """
+        it = iter(records_iter)
 
-            batch_records = [
-                models.Record(
-                    id=batch_record_ids[x],
-                    vector=batch_vectors[x],
+        def next_batch():
+            return [
+                models.PointStruct(
+                    id=rec_id,
+                    vector=vector,
                     payload={
-                        "text": batch_texts[x],
-                        "metadata": batch_metadata[x]
+                        "text": text,
+                        "metadata": meta
                     }
                 )
-                for x in range(len(batch_texts))
+                for rec_id, vector, text, meta in
+                itertools.islice(it, batch_size)
             ]
 
+        try:
+            # One batch of lookahead: only once the next batch is known to be
+            # non-empty is the pending one sent wait=False; the last batch is
+            # sent wait=True, so returning True means the stream is persisted.
+            pending = next_batch()
+            while pending:
+                points = next_batch()
+                self.client.upsert(
+                    collection_name=collection_name,
+                    points=pending,
+                    wait=not points
+                )
+                pending = points
+        except Exception as e:
+            self.logger.error(f"Error while streaming records: {e}")
+            return False
+
+        self._mark_exists(collection_name)
+        return True
+
+    async def ainsert_many(self, collection_name: str, texts: list,
+                           vectors: list, metadata: list = None,
+                           record_ids: list = None, batch_size: int = 50,
+                           concurrency: int = 4) -> bool:
+        """
+        Async variant of `insert_many` that upserts batches concurrently.
+
+        Up to `concurrency` batches are in flight at once, overlapping the
+        per-batch network round-trip and server-side write work instead of
+        paying them serially.
+
+        :param collection_name: Name of the collection.
+        :param texts: List of text data entries.
+        :param vectors: List of embedding vectors, same length as texts.
+        :param metadata: Optional list of metadata dictionaries, same length as texts.
+        :param record_ids: Optional list of unique IDs for each record.
+        :param batch_size: How many records to upsert per request.
+        :param concurrency: Maximum number of in-flight upsert requests.
+        :return: True if all upserts succeed, False otherwise.
+        """
+        n = len(texts)
+        if metadata is None:
+            metadata = [None] * n
+
+        if record_ids is None:
+            record_ids = list(range(0, n))
+
+        # Same contiguous float32 buffer as insert_many; rows are unboxed to
+        # lists only at PointStruct construction time.
+        if not isinstance(vectors, np.ndarray):
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+        # zip hands each record's fields over directly instead of four
+        # integer __getitem__ calls per record, and islice walks the single
+        # zipped iterator so no per-batch list slices are allocated.
+        records = zip(record_ids, vectors, texts, metadata)
+        batches = []
+        while True:
+            points = [
+                models.PointStruct(
+                    id=rec_id,
+                    vector=vector.tolist(),
+                    payload={
+                        "text": text,
+                        "metadata": meta
+                    }
+                )
+                for rec_id, vector, text, meta in
+                itertools.islice(records, batch_size)
+            ]
+            if not points:
+                break
+            batches.append(points)
+
+        if not batches:
+            return True
+
+        try:
+            client = self._get_async_client()
+        except Exception as e:
+            # In the default path-mode setup the sync client from connect()
+            # already holds the storage lock, so a second (async) client
+            # cannot open it; fall back to serial sync upserts rather than
+            # crash out of the documented True/False contract.
+            self.logger.warning(
+                f"Async client unavailable, falling back to sync upserts: {e}"
+            )
             try:
-                _ = self.client.upload_records(
+                for points in batches[:-1]:
+                    self.client.upsert(
+                        collection_name=collection_name,
+                        points=points,
+                        wait=False
+                    )
+                self.client.upsert(
                     collection_name=collection_name,
-                    records=batch_records,
+                    points=batches[-1],
+                    wait=True
                 )
             except Exception as e:
-                self.logger.error(f"Error while inserting batch [{i}:{batch_end}]: {e}")
+                self.logger.error(f"Error while async-uploading {n} records: {e}")
                 return False
+            self._mark_exists(collection_name)
+            return True
+
+        semaphore = asyncio.Semaphore(concurrency)
 
+        async def upsert_batch(points, wait=False):
+            async with semaphore:
+                await client.upsert(
+                    collection_name=collection_name,
+                    points=points,
+                    wait=wait
+                )
+
+        try:
+            # wait=False lets the server flush one batch while the next is
+            # already on the wire; the final batch waits, so returning True
+            # means the whole load has been persisted.
+            await asyncio.gather(*(upsert_batch(batch) for batch in batches[:-1]))
+            await upsert_batch(batches[-1], wait=True)
+        except Exception as e:
+            self.logger.error(f"Error while async-uploading {n} records: {e}")
+            return False
+
+        self._mark_exists(collection_name)
         return True
-        
+
     def search_by_vector(self, collection_name: str, vector: list, limit: int = 5) -> List[RetrievedDocument]:
         """
         Performs a similarity search in the specified collection.
@@ -262,19 +645,70 @@ class QdrantDBProvider(VectorDBInterface):
         :param limit: The maximum number of matching records to return.
         :return: A list of RetrievedDocument objects (text and score) or None if no matches.
         """
-        results = self.client.search(
+        # query_points is the successor to the deprecated client.search and
+        # returns a lighter response object.
+        # Project only the text field so large metadata blobs never cross
+        # the wire on the hot search path.
+        results = self.client.query_points(
             collection_name=collection_name,
-            query_vector=vector,
-            limit=limit
-        )
+            query=vector,
+            limit=limit,
+            with_payload=models.PayloadSelectorInclude(include=["text"]),
+            search_params=models.SearchParams(
+                hnsw_ef=self.search_ef,
+                quantization=models.QuantizationSearchParams(rescore=True)
+            )
+        ).points
 
         if not results or len(results) == 0:
             return None  # Return None or an empty list for no results
-        
-        return [
-            RetrievedDocument(
+
+        # RetrievedDocument is already slotted; preallocating the list avoids
+        # the append-time growth reallocations for large limits.
+        retrieved_documents = [None] * len(results)
+        for i, result in enumerate(results):
+            retrieved_documents[i] = RetrievedDocument(
                 score=result.score,
                 text=result.payload["text"]
             )
-            for result in results
+        return retrieved_documents
+
+    def search_batch(self, collection_name: str, vectors: list,
+                     limit: int = 5) -> List[List[RetrievedDocument]]:
+        """
+        Runs several similarity searches in one request.
+
+        Bundling N queries into a single search_batch call amortizes one
+        round-trip for all of them and lets the server parallelize the
+        lookups internally.
+
+        :param collection_name: The collection to search within.
+        :param vectors: List of query embedding vectors.
+        :param limit: The maximum number of matching records per query.
+        :return: One list of RetrievedDocument objects per query vector.
+        """
+        requests = [
+            models.QueryRequest(
+                query=vector,
+                limit=limit,
+                with_payload=models.PayloadSelectorInclude(include=["text"]),
+                params=models.SearchParams(
+                    hnsw_ef=self.search_ef,
+                    quantization=models.QuantizationSearchParams(rescore=True)
+                )
+            )
+            for vector in vectors
+        ]
+        # query_batch_points is the batched counterpart of query_points.
+        results = self.client.query_batch_points(
+            collection_name=collection_name,
+            requests=requests
+        )
+
+        return [
+            [
+                RetrievedDocument(score=hit.score, text=hit.payload["text"])
+                for hit in response.points
+            ]
+            for response in results
         ]